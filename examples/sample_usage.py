@@ -1,29 +1,26 @@
 """
 Sample script demonstrating various ways to use the AWS SES client.
 """
-import argparse
 import json
 import sys
-from typing import Dict, List, Optional
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
-from aws_ses.profile_manager import ProfileManager
-from aws_ses.ses_client import SESClient
+from aws_ses import ProfileManager, SESClient
 
+if TYPE_CHECKING:
+    import argparse
 
-def send_simple_email(
-    profile_name: Optional[str], region_name: Optional[str]
-) -> None:
+
+def send_simple_email(ses_client: SESClient) -> None:
     """
     Send a simple plain text email.
     
     Args:
-        profile_name: AWS profile to use
-        region_name: AWS region to use
+        ses_client: SES client to use
     """
     print("Sending a simple plain text email...")
     
-    ses_client = SESClient(profile_name=profile_name, region_name=region_name)
-    
     response = ses_client.send_email(
         source="sender@example.com",
         to_addresses="recipient@example.com",
@@ -34,20 +31,15 @@ def send_simple_email(
     print(f"Email sent! Message ID: {response['MessageId']}")
 
 
-def send_html_email(
-    profile_name: Optional[str], region_name: Optional[str]
-) -> None:
+def send_html_email(ses_client: SESClient) -> None:
     """
     Send an email with both plain text and HTML content.
     
     Args:
-        profile_name: AWS profile to use
-        region_name: AWS region to use
+        ses_client: SES client to use
     """
     print("Sending an email with HTML content...")
     
-    ses_client = SESClient(profile_name=profile_name, region_name=region_name)
-    
     html_body = """
     <html>
     <head></head>
@@ -75,20 +67,15 @@ def send_html_email(
     print(f"HTML email sent! Message ID: {response['MessageId']}")
 
 
-def send_email_with_cc_bcc(
-    profile_name: Optional[str], region_name: Optional[str]
-) -> None:
+def send_email_with_cc_bcc(ses_client: SESClient) -> None:
     """
     Send an email with CC and BCC recipients.
     
     Args:
-        profile_name: AWS profile to use
-        region_name: AWS region to use
+        ses_client: SES client to use
     """
     print("Sending an email with CC and BCC recipients...")
     
-    ses_client = SESClient(profile_name=profile_name, region_name=region_name)
-    
     response = ses_client.send_email(
         source="sender@example.com",
         to_addresses=["primary@example.com", "another-primary@example.com"],
@@ -102,21 +89,16 @@ def send_email_with_cc_bcc(
     print(f"Email with CC/BCC sent! Message ID: {response['MessageId']}")
 
 
-def verify_email_address(
-    profile_name: Optional[str], region_name: Optional[str], email: str
-) -> None:
+def verify_email_address(ses_client: SESClient, email: str) -> None:
     """
     Verify an email address with AWS SES.
     
     Args:
-        profile_name: AWS profile to use
-        region_name: AWS region to use
+        ses_client: SES client to use
         email: Email address to verify
     """
     print(f"Verifying email address: {email}...")
     
-    ses_client = SESClient(profile_name=profile_name, region_name=region_name)
-    
     ses_client.verify_email_identity(email)
     
     print(
@@ -125,20 +107,15 @@ def verify_email_address(
     )
 
 
-def list_verified_emails(
-    profile_name: Optional[str], region_name: Optional[str]
-) -> None:
+def list_verified_emails(ses_client: SESClient) -> None:
     """
     List all verified email addresses.
     
     Args:
-        profile_name: AWS profile to use
-        region_name: AWS region to use
+        ses_client: SES client to use
     """
     print("Listing verified email addresses...")
     
-    ses_client = SESClient(profile_name=profile_name, region_name=region_name)
-    
     emails = ses_client.list_verified_email_addresses()
     
     if emails:
@@ -149,20 +126,15 @@ def list_verified_emails(
         print("No verified email addresses found.")
 
 
-def check_sending_quota(
-    profile_name: Optional[str], region_name: Optional[str]
-) -> None:
+def check_sending_quota(ses_client: SESClient) -> None:
     """
     Check the SES sending quota.
     
     Args:
-        profile_name: AWS profile to use
-        region_name: AWS region to use
+        ses_client: SES client to use
     """
     print("Checking SES sending quota...")
     
-    ses_client = SESClient(profile_name=profile_name, region_name=region_name)
-    
     quota = ses_client.get_send_quota()
     
     print("SES Sending Quota:")
@@ -171,20 +143,15 @@ def check_sending_quota(
     print(f"  Sent Last 24 Hours: {quota['SentLast24Hours']}")
 
 
-def check_sending_statistics(
-    profile_name: Optional[str], region_name: Optional[str]
-) -> None:
+def check_sending_statistics(ses_client: SESClient) -> None:
     """
     Check the SES sending statistics.
     
     Args:
-        profile_name: AWS profile to use
-        region_name: AWS region to use
+        ses_client: SES client to use
     """
     print("Checking SES sending statistics...")
     
-    ses_client = SESClient(profile_name=profile_name, region_name=region_name)
-    
     stats = ses_client.get_send_statistics()
     
     if stats.get("SendDataPoints"):
@@ -230,7 +197,7 @@ def simulate_lambda_invocation(
         profile_name: AWS profile to use
         region_name: AWS region to use
     """
-    from aws_ses.lambda_handler import handler
+    from aws_ses import handler
     
     print("Simulating Lambda invocation...")
     
@@ -252,8 +219,31 @@ def simulate_lambda_invocation(
     print(json.dumps(response, indent=2))
 
 
-def main() -> None:
-    """Main function to demonstrate various AWS SES operations."""
+ACTIONS = [
+    "send-simple",
+    "send-html",
+    "send-with-cc-bcc",
+    "verify-email",
+    "list-verified",
+    "check-quota",
+    "check-stats",
+    "list-profiles",
+    "simulate-lambda",
+    "run-all"
+]
+
+OPTIONS = ("--profile", "--region", "--action", "--email")
+
+
+def build_parser() -> "argparse.ArgumentParser":
+    """
+    Build the full argument parser, used for --help and usage errors.
+    
+    Returns:
+        argparse.ArgumentParser: The argument parser
+    """
+    import argparse
+
     parser = argparse.ArgumentParser(description="AWS SES Sample Usage")
     parser.add_argument(
         "--profile", 
@@ -262,24 +252,66 @@ def main() -> None:
     parser.add_argument("--region", help="AWS region to use.")
     parser.add_argument(
         "--action",
-        choices=[
-            "send-simple",
-            "send-html",
-            "send-with-cc-bcc",
-            "verify-email",
-            "list-verified",
-            "check-quota",
-            "check-stats",
-            "list-profiles",
-            "simulate-lambda",
-            "run-all"
-        ],
+        choices=ACTIONS,
         required=True,
         help="Action to perform"
     )
     parser.add_argument("--email", help="Email address for verification")
+    return parser
+
+
+def parse_args(argv: List[str]) -> Any:
+    """
+    Parse command-line arguments.
+    
+    Well-formed arguments are parsed directly; argparse is only loaded to
+    print help or report a usage error.
     
-    args = parser.parse_args()
+    Args:
+        argv: Command-line arguments, excluding the program name
+    
+    Returns:
+        The parsed arguments, with profile, region, action and email attributes
+    """
+    values: Dict[str, Optional[str]] = dict.fromkeys(
+        ["profile", "region", "action", "email"]
+    )
+    remaining = iter(argv)
+    for arg in remaining:
+        option, has_value, value = arg.partition("=")
+        if option not in OPTIONS:
+            break
+        if not has_value:
+            value = next(remaining, "-")
+            if value.startswith("-"):
+                break
+        values[option[2:]] = value
+    else:
+        if values["action"] in ACTIONS:
+            return SimpleNamespace(**values)
+
+    return build_parser().parse_args(argv)
+
+
+# Actions that only need an SES client, in the order run-all performs them
+CLIENT_ACTIONS: Dict[str, Callable[[SESClient], None]] = {
+    "send-simple": send_simple_email,
+    "send-html": send_html_email,
+    "send-with-cc-bcc": send_email_with_cc_bcc,
+    "list-verified": list_verified_emails,
+    "check-quota": check_sending_quota,
+    "check-stats": check_sending_statistics,
+}
+
+# Actions that need an SES client and the --email address
+CLIENT_ACTIONS_WITH_EMAIL: Dict[str, Callable[[SESClient, str], None]] = {
+    "verify-email": verify_email_address,
+}
+
+
+def main() -> None:
+    """Main function to demonstrate various AWS SES operations."""
+    args = parse_args(sys.argv[1:])
     
     # Validate profile if provided
     if args.profile and not ProfileManager.validate_profile(args.profile):
@@ -289,25 +321,12 @@ def main() -> None:
             print(f"Profile '{args.profile}' not found", file=sys.stderr)
         sys.exit(1)
     
+    if args.action == "verify-email" and not args.email:
+        print("Email address is required for verification", file=sys.stderr)
+        sys.exit(1)
+
     # Execute the requested action
-    if args.action == "send-simple":
-        send_simple_email(args.profile, args.region)
-    elif args.action == "send-html":
-        send_html_email(args.profile, args.region)
-    elif args.action == "send-with-cc-bcc":
-        send_email_with_cc_bcc(args.profile, args.region)
-    elif args.action == "verify-email":
-        if not args.email:
-            print("Email address is required for verification", file=sys.stderr)
-            sys.exit(1)
-        verify_email_address(args.profile, args.region, args.email)
-    elif args.action == "list-verified":
-        list_verified_emails(args.profile, args.region)
-    elif args.action == "check-quota":
-        check_sending_quota(args.profile, args.region)
-    elif args.action == "check-stats":
-        check_sending_statistics(args.profile, args.region)
-    elif args.action == "list-profiles":
+    if args.action == "list-profiles":
         list_aws_profiles()
     elif args.action == "simulate-lambda":
         simulate_lambda_invocation(args.profile, args.region)
@@ -317,32 +336,27 @@ def main() -> None:
         print("\n" + "-" * 50 + "\n")
         
         try:
-            send_simple_email(args.profile, args.region)
-            print("\n" + "-" * 50 + "\n")
-            
-            send_html_email(args.profile, args.region)
-            print("\n" + "-" * 50 + "\n")
-            
-            send_email_with_cc_bcc(args.profile, args.region)
-            print("\n" + "-" * 50 + "\n")
-            
-            list_verified_emails(args.profile, args.region)
-            print("\n" + "-" * 50 + "\n")
-            
-            check_sending_quota(args.profile, args.region)
-            print("\n" + "-" * 50 + "\n")
-            
-            check_sending_statistics(args.profile, args.region)
-            print("\n" + "-" * 50 + "\n")
+            # Build the client once and share it across all operations
+            ses_client = SESClient(profile_name=args.profile, region_name=args.region)
+
+            for action in CLIENT_ACTIONS.values():
+                action(ses_client)
+                print("\n" + "-" * 50 + "\n")
             
             simulate_lambda_invocation(args.profile, args.region)
             
             if args.email:
                 print("\n" + "-" * 50 + "\n")
-                verify_email_address(args.profile, args.region, args.email)
+                verify_email_address(ses_client, args.email)
         except Exception as e:
             print(f"Error during sample operations: {e}", file=sys.stderr)
             sys.exit(1)
+    else:
+        ses_client = SESClient(profile_name=args.profile, region_name=args.region)
+        if args.action in CLIENT_ACTIONS_WITH_EMAIL:
+            CLIENT_ACTIONS_WITH_EMAIL[args.action](ses_client, args.email)
+        else:
+            CLIENT_ACTIONS[args.action](ses_client)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,44 @@
+"""
+AWS SES email sender with multiple profile support.
+
+Public names are resolved lazily (PEP 562), so ``import aws_ses`` stays cheap
+until one of them is actually used.
+"""
+import logging
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from aws_ses.lambda_handler import handler
+    from aws_ses.profile_manager import ProfileManager
+    from aws_ses.ses_client import SESClient
+
+__version__ = "0.1.0"
+
+# Library logging stays silent unless the application configures a handler
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+__all__ = ["SESClient", "ProfileManager", "handler"]
+
+
+def __getattr__(name: str) -> Any:
+    # Cache on the module so later lookups skip __getattr__ entirely
+    if name == "SESClient":
+        from aws_ses.ses_client import SESClient
+
+        globals()[name] = SESClient
+        return SESClient
+    if name == "ProfileManager":
+        from aws_ses.profile_manager import ProfileManager
+
+        globals()[name] = ProfileManager
+        return ProfileManager
+    if name == "handler":
+        from aws_ses.lambda_handler import handler
+
+        globals()[name] = handler
+        return handler
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
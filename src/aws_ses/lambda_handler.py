@@ -3,10 +3,22 @@ AWS Lambda handler for sending emails via SES.
 """
 import json
 import os
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 from aws_ses.ses_client import SESClient
 
+# Response bodies that do not depend on the invocation are built once
+_MISSING_PARAMS_BODY = json.dumps(
+    {
+        "message": "Missing required parameters. Required: source, to_addresses, subject, body_text"
+    }
+)
+_SUCCESS_BODY_TEMPLATE = '{"message": "Email sent successfully", "messageId": %s}'
+
+# SES clients keyed by (profile, region). Module globals survive between warm
+# invocations of the same Lambda container, so each client is built only once.
+_CLIENTS: Dict[Tuple[Optional[str], Optional[str]], SESClient] = {}
+
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
@@ -50,15 +62,14 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
 
         # Validate required parameters
         if not all([source, to_addresses, subject, body_text]):
-            return {
-                "statusCode": 400,
-                "body": json.dumps({
-                    "message": "Missing required parameters. Required: source, to_addresses, subject, body_text"
-                })
-            }
+            return {"statusCode": 400, "body": _MISSING_PARAMS_BODY}
 
-        # Initialize SES client
-        ses_client = SESClient(profile_name=profile_name, region_name=region_name)
+        # Reuse the SES client from a previous invocation if possible
+        key = (profile_name, region_name)
+        ses_client = _CLIENTS.get(key)
+        if ses_client is None:
+            ses_client = SESClient(profile_name=profile_name, region_name=region_name)
+            _CLIENTS[key] = ses_client
         
         # Send the email
         response = ses_client.send_email(
@@ -75,17 +86,14 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         # Return success response
         return {
             "statusCode": 200,
-            "body": json.dumps({
-                "message": "Email sent successfully",
-                "messageId": response["MessageId"]
-            })
+            "body": _SUCCESS_BODY_TEMPLATE % json.dumps(response["MessageId"]),
         }
         
     except Exception as e:
         # Return error response
         return {
             "statusCode": 500,
-            "body": json.dumps({
-                "message": f"Error sending email: {str(e)}"
-            })
+            "body": json.dumps(
+                {"message": f"Error sending email: {e}"}, separators=(",", ":")
+            ),
         }
@@ -1,10 +1,111 @@
 """
 AWS profile manager for handling multiple profiles including 'latest'.
 """
-from typing import List, Optional
+import os
+import re
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
-import boto3
-from botocore.exceptions import ProfileNotFound
+# Section header as recognised by configparser, which botocore uses. Lines are
+# stripped first, so indented headers still count.
+_SECTION_HEADER = re.compile(r"\[(?P<header>.+)\]")
+
+
+class _ProfileScan(NamedTuple):
+    """Profiles found in the AWS config files."""
+
+    profiles: Tuple[str, ...]
+    latest: Optional[str]
+
+
+# ((path, mtime_ns, size) for each file, scan result) from the last scan
+_scan_cache: Optional[Tuple[Tuple[Tuple[str, int, int], ...], _ProfileScan]] = None
+
+
+def _file_state(path: str) -> Tuple[str, int, int]:
+    """
+    Get the modification time and size of a file, or -1 for both if it is missing.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return path, -1, -1
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+def _read_sections(path: str) -> List[str]:
+    """
+    Read the section names of an AWS shared config or credentials file.
+
+    Args:
+        path: Path to the file; a missing file has no sections
+
+    Returns:
+        List[str]: Section names in header order, including repeats
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            lines = f.readlines()
+    except OSError:
+        return []
+    sections = []
+    for line in lines:
+        match = _SECTION_HEADER.match(line.strip())
+        if match:
+            sections.append(match.group("header"))
+    return sections
+
+
+def _scan_profiles() -> _ProfileScan:
+    """
+    Read profile names from the shared config and credentials files without
+    creating a boto3 session.
+
+    Profiles are listed in the same order boto3 reports them: those defined in
+    the config file first, then any that only appear in the credentials file.
+    The latest profile is the last non-default section written to the credentials
+    file, falling back to the last non-default profile in the config file and
+    then to ``default``.
+
+    The result is cached until either file's modification time or size changes,
+    so repeated calls only cost two ``stat`` calls. ``ProfileManager.clear_cache``
+    forces a re-read.
+
+    Returns:
+        _ProfileScan: Available profile names and the latest profile
+    """
+    global _scan_cache
+
+    config_file = os.path.expanduser(
+        os.environ.get("AWS_CONFIG_FILE", "~/.aws/config")
+    )
+    credentials_file = os.path.expanduser(
+        os.environ.get("AWS_SHARED_CREDENTIALS_FILE", "~/.aws/credentials")
+    )
+    state = (_file_state(config_file), _file_state(credentials_file))
+    if _scan_cache is not None and _scan_cache[0] == state:
+        return _scan_cache[1]
+
+    profiles: Dict[str, None] = {}
+    for section in _read_sections(config_file):
+        # Other sections (e.g. "sso-session ...") are not profiles
+        if section == "default":
+            profiles[section] = None
+        elif section.startswith("profile "):
+            profiles[section[len("profile ") :].strip()] = None
+
+    latest: Optional[str] = None
+    for section in _read_sections(credentials_file):
+        profiles[section] = None
+        if section != "default":
+            latest = section
+
+    if latest is None:
+        fallback = [name for name in profiles if name != "default"] or list(profiles)
+        latest = fallback[-1] if fallback else None
+
+    scan = _ProfileScan(tuple(profiles), latest)
+    _scan_cache = (state, scan)
+    return scan
 
 
 class ProfileManager:
@@ -20,26 +121,50 @@ class ProfileManager:
         Returns:
             List[str]: List of available profile names
         """
-        return boto3.Session().available_profiles
+        return list(_scan_profiles().profiles)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Forget the cached profile list so the AWS config files are read again.
+        """
+        global _scan_cache
+        _scan_cache = None
 
     @staticmethod
     def get_latest_profile() -> Optional[str]:
         """
         Get the most recently added AWS profile.
-        Assumes the most recently added profile is the last one in the list.
+        This is the last non-default section in the credentials file, or the last
+        available profile if the credentials file has none.
 
         Returns:
             Optional[str]: The name of the latest profile, or None if no profiles exist
         """
-        profiles = ProfileManager.get_available_profiles()
-        if not profiles:
-            return None
-        return profiles[-1]
+        return _scan_profiles().latest
 
     @staticmethod
     def validate_profile(profile_name: str) -> bool:
         """
-        Validate that a profile exists.
+        Validate that a profile exists in the AWS config or credentials file.
+
+        Args:
+            profile_name: The name of the profile to validate
+
+        Returns:
+            bool: True if the profile exists, False otherwise
+        """
+        if profile_name.lower() == "latest":
+            # Check if any profiles exist
+            return bool(ProfileManager.get_available_profiles())
+
+        return profile_name in _scan_profiles().profiles
+
+    @staticmethod
+    def validate_profile_strict(profile_name: str) -> bool:
+        """
+        Validate that a profile exists by creating a boto3 session for it.
+        Slower than ``validate_profile``, but uses boto3's own profile lookup.
 
         Args:
             profile_name: The name of the profile to validate
@@ -51,6 +176,9 @@ class ProfileManager:
             # Check if any profiles exist
             return bool(ProfileManager.get_available_profiles())
 
+        import boto3
+        from botocore.exceptions import ProfileNotFound
+
         try:
             # Try to create a session with the profile to validate it
             boto3.Session(profile_name=profile_name)
@@ -1,19 +1,180 @@
 """
 AWS SES client for sending emails.
 """
-from typing import Dict, List, Optional, Union
+import json
+import logging
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from aws_ses.profile_manager import ProfileManager
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    import boto3
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# SendBulkTemplatedEmail accepts at most this many destinations per request
+_BULK_DESTINATIONS_LIMIT = 50
+
+# How long get_send_quota and list_verified_email_addresses reuse a response
+_QUOTA_TTL_SECONDS = 60.0
+_VERIFIED_TTL_SECONDS = 300.0
+
+# Sessions and SES clients shared by every SESClient created with the same
+# (resolved profile, region, connection pool size). Building a client loads the
+# service model and resolves credentials, so it is only done once per key.
+_CLIENT_CACHE: Dict[
+    Tuple[Optional[str], Optional[str], int], Tuple["boto3.Session", Any]
+] = {}
+
+
+def _as_list(value: Optional[Union[str, Sequence[str]]]) -> Optional[List[str]]:
+    """
+    Normalize one or more email addresses to a list.
+
+    Args:
+        value: A single address, a sequence of addresses, or None
+
+    Returns:
+        Optional[List[str]]: The addresses as a new list, or None if there are none
+    """
+    if not value:
+        return None
+    if isinstance(value, str):
+        return [value]
+    return list(value)
+
+
+def _recipient_count(*addresses: Optional[Union[str, Sequence[str]]]) -> int:
+    """
+    Count the recipients across address fields, as SES does for ``MaxSendRate``.
+
+    Args:
+        addresses: To, CC and BCC fields, each in any form ``_as_list`` accepts
+
+    Returns:
+        int: The number of recipients, at least 1
+    """
+    return max(1, sum(len(_as_list(value) or ()) for value in addresses))
 
-import boto3
-from botocore.exceptions import ClientError
+
+def _outcome(future: "Future") -> Union[Dict, Exception]:
+    """
+    Get the result of a completed future, or the exception it raised.
+    """
+    error = future.exception()
+    if isinstance(error, Exception):
+        return error
+    return future.result()
+
+
+def _template(
+    template_name: str,
+    subject: str,
+    body_text: Optional[str],
+    body_html: Optional[str],
+) -> Dict[str, str]:
+    """
+    Build the ``Template`` parameter for CreateTemplate and UpdateTemplate.
+    """
+    template = {"TemplateName": template_name, "SubjectPart": subject}
+    if body_text is not None:
+        template["TextPart"] = body_text
+    if body_html is not None:
+        template["HtmlPart"] = body_html
+    return template
+
+
+def _template_data(data: Optional[Union[str, Dict[str, Any]]]) -> str:
+    """
+    Serialize template replacement data to the JSON string SES expects.
+    """
+    if data is None:
+        return "{}"
+    if isinstance(data, str):
+        return data
+    return json.dumps(data)
+
+
+def clear_client_cache() -> None:
+    """
+    Drop all cached sessions and clients, e.g. after credentials have changed.
+    """
+    _CLIENT_CACHE.clear()
+
+
+class _RateLimiter:
+    """
+    Spaces out calls so that no more than ``rate`` start in any second.
+    Safe to share between threads.
+    """
+
+    def __init__(self, rate: float):
+        """
+        Args:
+            rate: Maximum number of calls per second. Zero or less disables pacing.
+        """
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_start = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self, count: int = 1) -> None:
+        """
+        Block until the caller is allowed to start its next call.
+
+        Args:
+            count: Number of units (e.g. recipients) the call counts as
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = max(self._next_start, now)
+            self._next_start = start + self._interval * count
+        if start > now:
+            time.sleep(start - now)
 
 
 class SESClient:
     """
     Client for interacting with AWS SES service.
     Supports multiple AWS profiles including a special 'latest' profile.
+    Instances with the same profile and region share one boto3 session and
+    SES client.
     """
 
-    def __init__(self, profile_name: Optional[str] = None, region_name: Optional[str] = None):
+    __slots__ = (
+        "profile_name",
+        "region_name",
+        "max_pool_connections",
+        "session",
+        "client",
+        "_quota_cache",
+        "_verified_cache",
+    )
+
+    def __init__(
+        self,
+        profile_name: Optional[str] = None,
+        region_name: Optional[str] = None,
+        max_pool_connections: int = 20,
+    ):
         """
         Initialize the SES client with optional profile and region.
 
@@ -21,43 +182,72 @@ class SESClient:
             profile_name: AWS profile name to use. If 'latest', will use the most recently
                           added profile. If None, will use the default profile.
             region_name: AWS region to use. If None, will use the region from the profile.
+            max_pool_connections: Size of the HTTP connection pool. Concurrent sends
+                                  beyond this wait for a free connection, so it also
+                                  caps the default concurrency of send_emails_bulk;
+                                  raise it if the account's MaxSendRate is higher.
+
+        Raises:
+            ValueError: If 'latest' is specified but no profiles exist
         """
-        self.profile_name = profile_name
+        self.profile_name = ProfileManager.resolve_profile_name(profile_name)
         self.region_name = region_name
-        self.session = self._create_session()
-        self.client = self.session.client("ses", region_name=region_name)
-
-    def _create_session(self) -> boto3.Session:
+        self.max_pool_connections = max_pool_connections
+        self._quota_cache: Optional[Tuple[float, Dict]] = None
+        self._verified_cache: Optional[Tuple[float, List[str]]] = None
+
+        key = (self.profile_name, region_name, max_pool_connections)
+        cached = _CLIENT_CACHE.get(key)
+        if cached is None:
+            session = self._create_session()
+            client = self._create_client(session)
+            cached = _CLIENT_CACHE.setdefault(key, (session, client))
+        self.session, self.client = cached
+
+    def _create_session(self) -> "boto3.Session":
         """
-        Create a boto3 session using the specified profile.
-        If profile is 'latest', use the most recently added profile.
+        Create a boto3 session using the resolved profile.
 
         Returns:
             boto3.Session: The created session
         """
+        import boto3
+
         if not self.profile_name:
             return boto3.Session()
 
-        if self.profile_name.lower() == "latest":
-            # Get available profiles and select the most recently added one
-            available_profiles = boto3.Session().available_profiles
-            if not available_profiles:
-                raise ValueError("No AWS profiles found")
-            # Assuming the most recently added profile is the last one in the list
-            self.profile_name = available_profiles[-1]
-
         return boto3.Session(profile_name=self.profile_name)
 
+    def _create_client(self, session: "boto3.Session") -> Any:
+        """
+        Create the SES client, with a connection pool sized for concurrent sends,
+        TCP keepalive and adaptive (client-side rate limited) retries.
+
+        Args:
+            session: The session to create the client from
+
+        Returns:
+            The SES client
+        """
+        from botocore.config import Config
+
+        config = Config(
+            max_pool_connections=self.max_pool_connections,
+            retries={"mode": "adaptive", "max_attempts": 5},
+            tcp_keepalive=True,
+        )
+        return session.client("ses", region_name=self.region_name, config=config)
+
     def send_email(
         self,
         source: str,
-        to_addresses: Union[str, List[str]],
+        to_addresses: Union[str, Sequence[str]],
         subject: str,
         body_text: str,
         body_html: Optional[str] = None,
-        cc_addresses: Optional[Union[str, List[str]]] = None,
-        bcc_addresses: Optional[Union[str, List[str]]] = None,
-        reply_to_addresses: Optional[Union[str, List[str]]] = None,
+        cc_addresses: Optional[Union[str, Sequence[str]]] = None,
+        bcc_addresses: Optional[Union[str, Sequence[str]]] = None,
+        reply_to_addresses: Optional[Union[str, Sequence[str]]] = None,
     ) -> Dict:
         """
         Send an email using AWS SES.
@@ -79,49 +269,298 @@ class SESClient:
             ClientError: If there is an error sending the email
         """
         # Convert single email addresses to lists
-        if isinstance(to_addresses, str):
-            to_addresses = [to_addresses]
-        if cc_addresses and isinstance(cc_addresses, str):
-            cc_addresses = [cc_addresses]
-        if bcc_addresses and isinstance(bcc_addresses, str):
-            bcc_addresses = [bcc_addresses]
-        if reply_to_addresses and isinstance(reply_to_addresses, str):
-            reply_to_addresses = [reply_to_addresses]
-
-        # Prepare the email message
-        message: Dict = {
-            "Subject": {"Data": subject},
-            "Body": {"Text": {"Data": body_text}},
-        }
-
-        if body_html:
-            message["Body"]["Html"] = {"Data": body_html}
+        to_list = _as_list(to_addresses) or []
+        cc_list = _as_list(cc_addresses)
+        bcc_list = _as_list(bcc_addresses)
+        reply_to_list = _as_list(reply_to_addresses)
+
+        # Prepare the email body
+        body: Dict = (
+            {"Text": {"Data": body_text}, "Html": {"Data": body_html}}
+            if body_html
+            else {"Text": {"Data": body_text}}
+        )
 
         # Prepare the destination
-        destination: Dict = {"ToAddresses": to_addresses}
-        if cc_addresses:
-            destination["CcAddresses"] = cc_addresses
-        if bcc_addresses:
-            destination["BccAddresses"] = bcc_addresses
+        destination: Dict = {"ToAddresses": to_list}
+        if cc_list:
+            destination["CcAddresses"] = cc_list
+        if bcc_list:
+            destination["BccAddresses"] = bcc_list
 
         # Prepare the email parameters
         email_params: Dict = {
             "Source": source,
             "Destination": destination,
-            "Message": message,
+            "Message": {"Subject": {"Data": subject}, "Body": body},
         }
 
-        if reply_to_addresses:
-            email_params["ReplyToAddresses"] = reply_to_addresses
+        if reply_to_list:
+            email_params["ReplyToAddresses"] = reply_to_list
+
+        from botocore.exceptions import ClientError
 
         try:
             response = self.client.send_email(**email_params)
             return response
-        except ClientError as e:
+        except ClientError:
             # Log the error and re-raise
-            print(f"Error sending email: {e}")
+            logger.exception("Error sending email")
+            raise
+
+    def send_emails_bulk(
+        self,
+        messages: Iterable[Dict[str, Any]],
+        max_in_flight: Optional[int] = None,
+    ) -> Iterator[Tuple[Dict[str, Any], Union[Dict, Exception]]]:
+        """
+        Send many emails concurrently, paced to the account's maximum send rate.
+
+        Requests share this client and run on a thread pool. At most
+        ``max_in_flight`` requests are outstanding at once, and they are paced so
+        that no more than ``MaxSendRate`` (from the cached send quota) recipients
+        are sent to per second. Every To, CC and BCC address counts.
+
+        Args:
+            messages: Keyword arguments for each ``send_email`` call
+            max_in_flight: Maximum number of concurrent requests. Defaults to the
+                           account's maximum send rate, capped at the connection
+                           pool size.
+
+        Yields:
+            Tuple[Dict, Union[Dict, Exception]]: Each message together with its SES
+                response, or the exception raised while sending it, in the order
+                the requests complete
+        """
+        return self._send_concurrently(
+            lambda message: self.send_email(**message),
+            messages,
+            max_in_flight,
+            weight=lambda message: _recipient_count(
+                message.get("to_addresses"),
+                message.get("cc_addresses"),
+                message.get("bcc_addresses"),
+            ),
+        )
+
+    def create_template(
+        self,
+        template_name: str,
+        subject: str,
+        body_text: Optional[str] = None,
+        body_html: Optional[str] = None,
+    ) -> Dict:
+        """
+        Create an email template for use with ``send_bulk_templated``.
+
+        Args:
+            template_name: The name of the template
+            subject: The subject line, which may contain replacement tags
+            body_text: The plain text body (optional)
+            body_html: The HTML body (optional)
+
+        Returns:
+            Dict: The response from the SES service
+
+        Raises:
+            ClientError: If there is an error creating the template
+        """
+        from botocore.exceptions import ClientError
+
+        template = _template(template_name, subject, body_text, body_html)
+        try:
+            response = self.client.create_template(Template=template)
+            return response
+        except ClientError:
+            logger.exception("Error creating template")
             raise
 
+    def update_template(
+        self,
+        template_name: str,
+        subject: str,
+        body_text: Optional[str] = None,
+        body_html: Optional[str] = None,
+    ) -> Dict:
+        """
+        Replace the content of an existing email template.
+
+        Args:
+            template_name: The name of the template
+            subject: The subject line, which may contain replacement tags
+            body_text: The plain text body (optional)
+            body_html: The HTML body (optional)
+
+        Returns:
+            Dict: The response from the SES service
+
+        Raises:
+            ClientError: If there is an error updating the template
+        """
+        from botocore.exceptions import ClientError
+
+        template = _template(template_name, subject, body_text, body_html)
+        try:
+            response = self.client.update_template(Template=template)
+            return response
+        except ClientError:
+            logger.exception("Error updating template")
+            raise
+
+    def delete_template(self, template_name: str) -> Dict:
+        """
+        Delete an email template.
+
+        Args:
+            template_name: The name of the template
+
+        Returns:
+            Dict: The response from the SES service
+
+        Raises:
+            ClientError: If there is an error deleting the template
+        """
+        from botocore.exceptions import ClientError
+
+        try:
+            response = self.client.delete_template(TemplateName=template_name)
+            return response
+        except ClientError:
+            logger.exception("Error deleting template")
+            raise
+
+    def send_bulk_templated(
+        self,
+        source: str,
+        template_name: str,
+        destinations: Sequence[Dict[str, Any]],
+        default_data: Optional[Union[str, Dict[str, Any]]] = None,
+        max_in_flight: Optional[int] = None,
+    ) -> Iterator[Tuple[List[Dict[str, Any]], Union[Dict, Exception]]]:
+        """
+        Send a templated email to many destinations.
+
+        Destinations are grouped into ``SendBulkTemplatedEmail`` requests of up to
+        50 each, which are sent concurrently and paced like ``send_emails_bulk``
+        (every address in every destination counts towards ``MaxSendRate``). A
+        single destination is sent with ``SendTemplatedEmail`` instead.
+
+        Args:
+            source: The email address that is sending the email
+            template_name: The name of the template to use
+            destinations: One dict per destination with ``ToAddresses`` (an address or
+                          a list of addresses) and optionally
+                          ``ReplacementTemplateData`` (a dict or a JSON string)
+            default_data: Template data used where a destination has none
+            max_in_flight: Maximum number of concurrent requests. Defaults to the
+                           account's maximum send rate, capped at the connection
+                           pool size.
+
+        Yields:
+            Tuple[List[Dict], Union[Dict, Exception]]: Each group of destinations
+                together with its SES response, or the exception raised while
+                sending it, in the order the requests complete. Bulk responses hold
+                a ``Status`` entry per destination; a single-destination send
+                returns a ``MessageId``.
+        """
+        default_json = _template_data(default_data)
+
+        if len(destinations) == 1:
+
+            def send(chunk: List[Dict[str, Any]]) -> Dict:
+                destination = chunk[0]
+                return self.client.send_templated_email(
+                    Source=source,
+                    Template=template_name,
+                    Destination={"ToAddresses": _as_list(destination["ToAddresses"])},
+                    TemplateData=_template_data(
+                        destination.get("ReplacementTemplateData", default_data)
+                    ),
+                )
+
+        else:
+
+            def send(chunk: List[Dict[str, Any]]) -> Dict:
+                bulk_destinations = []
+                for destination in chunk:
+                    entry: Dict[str, Any] = {
+                        "Destination": {
+                            "ToAddresses": _as_list(destination["ToAddresses"])
+                        }
+                    }
+                    if "ReplacementTemplateData" in destination:
+                        entry["ReplacementTemplateData"] = _template_data(
+                            destination["ReplacementTemplateData"]
+                        )
+                    bulk_destinations.append(entry)
+                return self.client.send_bulk_templated_email(
+                    Source=source,
+                    Template=template_name,
+                    DefaultTemplateData=default_json,
+                    Destinations=bulk_destinations,
+                )
+
+        chunks = [
+            list(destinations[i : i + _BULK_DESTINATIONS_LIMIT])
+            for i in range(0, len(destinations), _BULK_DESTINATIONS_LIMIT)
+        ]
+        return self._send_concurrently(
+            send,
+            chunks,
+            max_in_flight,
+            weight=lambda chunk: _recipient_count(
+                *(destination["ToAddresses"] for destination in chunk)
+            ),
+        )
+
+    def _send_concurrently(
+        self,
+        send: Callable[[_T], Dict],
+        items: Iterable[_T],
+        max_in_flight: Optional[int],
+        weight: Callable[[_T], int],
+    ) -> Iterator[Tuple[_T, Union[Dict, Exception]]]:
+        """
+        Call ``send`` for each item on a thread pool, paced to the account's
+        maximum send rate.
+
+        Args:
+            send: Function that sends one item and returns the SES response
+            items: Items to send
+            max_in_flight: Maximum number of concurrent calls, or None for the
+                           account's maximum send rate capped at the pool size
+            weight: Number of recipients an item counts as towards the send rate
+
+        Yields:
+            Tuple[Any, Union[Dict, Exception]]: Each item with its response or
+                exception, in completion order
+        """
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        rate = float(self.get_send_quota()["MaxSendRate"])
+        if max_in_flight is None:
+            max_in_flight = max(1, min(int(rate), self.max_pool_connections))
+        limiter = _RateLimiter(rate)
+
+        def paced_send(item: _T) -> Dict:
+            limiter.wait(weight(item))
+            return send(item)
+
+        pending: Dict["Future", _T] = {}
+
+        def completed() -> Iterator[Tuple[_T, Union[Dict, Exception]]]:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), _outcome(future)
+
+        with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            for item in items:
+                if len(pending) >= max_in_flight:
+                    yield from completed()
+                pending[executor.submit(paced_send, item)] = item
+            while pending:
+                yield from completed()
+
     def verify_email_identity(self, email_address: str) -> Dict:
         """
         Verify an email address with AWS SES.
@@ -136,16 +575,24 @@ class SESClient:
         Raises:
             ClientError: If there is an error verifying the email
         """
+        from botocore.exceptions import ClientError
+
         try:
             response = self.client.verify_email_identity(EmailAddress=email_address)
+            # The new identity shows up in list_verified_email_addresses
+            self._verified_cache = None
             return response
-        except ClientError as e:
-            print(f"Error verifying email identity: {e}")
+        except ClientError:
+            logger.exception("Error verifying email identity")
             raise
 
-    def list_verified_email_addresses(self) -> List[str]:
+    def list_verified_email_addresses(self, force_refresh: bool = False) -> List[str]:
         """
         List all verified email addresses.
+        The list is cached for five minutes per client.
+
+        Args:
+            force_refresh: Fetch a fresh list even if a cached one is available
 
         Returns:
             List[str]: List of verified email addresses
@@ -153,16 +600,29 @@ class SESClient:
         Raises:
             ClientError: If there is an error listing the verified emails
         """
+        from botocore.exceptions import ClientError
+
+        if not force_refresh and self._verified_cache is not None:
+            fetched_at, emails = self._verified_cache
+            if time.monotonic() - fetched_at < _VERIFIED_TTL_SECONDS:
+                return emails
+
         try:
             response = self.client.list_identities(IdentityType="EmailAddress")
-            return response.get("Identities", [])
-        except ClientError as e:
-            print(f"Error listing verified email addresses: {e}")
+            emails = response.get("Identities", [])
+            self._verified_cache = (time.monotonic(), emails)
+            return emails
+        except ClientError:
+            logger.exception("Error listing verified email addresses")
             raise
 
-    def get_send_quota(self) -> Dict:
+    def get_send_quota(self, force_refresh: bool = False) -> Dict:
         """
         Get the SES sending quota.
+        The quota is cached for 60 seconds per client.
+
+        Args:
+            force_refresh: Fetch a fresh quota even if a cached one is available
 
         Returns:
             Dict: The SES sending quota information
@@ -170,11 +630,19 @@ class SESClient:
         Raises:
             ClientError: If there is an error getting the quota
         """
+        from botocore.exceptions import ClientError
+
+        if not force_refresh and self._quota_cache is not None:
+            fetched_at, quota = self._quota_cache
+            if time.monotonic() - fetched_at < _QUOTA_TTL_SECONDS:
+                return quota
+
         try:
             response = self.client.get_send_quota()
+            self._quota_cache = (time.monotonic(), response)
             return response
-        except ClientError as e:
-            print(f"Error getting send quota: {e}")
+        except ClientError:
+            logger.exception("Error getting send quota")
             raise
 
     def get_send_statistics(self) -> Dict:
@@ -187,9 +655,11 @@ class SESClient:
         Raises:
             ClientError: If there is an error getting the statistics
         """
+        from botocore.exceptions import ClientError
+
         try:
             response = self.client.get_send_statistics()
             return response
-        except ClientError as e:
-            print(f"Error getting send statistics: {e}")
+        except ClientError:
+            logger.exception("Error getting send statistics")
             raise
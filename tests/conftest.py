@@ -0,0 +1,22 @@
+"""
+Shared pytest configuration for the aws_ses tests.
+"""
+import os
+import sys
+
+import pytest
+
+# Add the src directory to the path so we can import the aws_ses module
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+
+@pytest.fixture(scope="session")
+def mock_aws_credentials():
+    """Mock AWS credentials once for the tests that build real boto3 clients."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("AWS_ACCESS_KEY_ID", "testing")
+        mp.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+        mp.setenv("AWS_SECURITY_TOKEN", "testing")
+        mp.setenv("AWS_SESSION_TOKEN", "testing")
+        mp.setenv("AWS_DEFAULT_REGION", "us-east-1")
+        yield
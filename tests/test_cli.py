@@ -0,0 +1,109 @@
+"""
+Unit tests for the command-line interface.
+"""
+import os
+import subprocess
+import sys
+from unittest.mock import Mock
+
+import pytest
+
+from aws_ses import cli
+
+
+@pytest.fixture
+def builders(monkeypatch):
+    """Wrap each subcommand builder in a mock that records whether it ran."""
+    wrapped = {name: Mock(wraps=build) for name, build in cli._SUBCOMMANDS.items()}
+    monkeypatch.setattr(cli, "_SUBCOMMANDS", wrapped)
+    return wrapped
+
+
+def run_main(monkeypatch, *args):
+    """Run the CLI entry point with the given arguments and return its exit code."""
+    monkeypatch.setattr(sys, "argv", ["aws-ses", *args])
+    with pytest.raises(SystemExit) as exc_info:
+        cli.main()
+    return exc_info.value.code
+
+
+class TestCLI:
+    """Test cases for the command-line interface."""
+
+    @pytest.mark.parametrize(
+        "args, expected",
+        [
+            (["send"], "send"),
+            (["-p", "send", "quota"], "quota"),
+            (["--profile", "dev", "-r", "us-east-1", "stats"], "stats"),
+            (["--region=us-west-2", "send"], "send"),
+            (["--help"], None),
+            ([], None),
+        ],
+    )
+    def test_find_subcommand(self, args, expected):
+        """Test that option values are skipped when looking for the subcommand."""
+        assert cli._find_subcommand(args) == expected
+
+    def test_main_registers_only_requested_subcommand(self, monkeypatch, builders):
+        """Test that a profile named like a command does not get it registered."""
+        from aws_ses import ProfileManager
+
+        monkeypatch.setattr(ProfileManager, "validate_profile", lambda name: True)
+
+        assert run_main(monkeypatch, "-p", "send", "quota", "--help") == 0
+
+        builders["quota"].assert_called_once()
+        for name, build in builders.items():
+            if name != "quota":
+                build.assert_not_called()
+
+    def test_main_unknown_command_suggests_match(self, monkeypatch, builders, capsys):
+        """Test that an unknown command still gets click's suggestion."""
+        assert run_main(monkeypatch, "sned") == 2
+
+        err = capsys.readouterr().err
+        assert "Did you mean" in err
+        assert "send" in err
+        for build in builders.values():
+            build.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "args", [["--version"], ["-V"], ["-p", "dev", "--version"]]
+    )
+    def test_version_output_matches(self, monkeypatch, capsys, args):
+        """Test that the fast and click version paths print the same thing."""
+        from aws_ses import __version__
+
+        monkeypatch.setattr(sys, "argv", ["aws-ses", *args])
+        try:
+            cli.main()
+        except SystemExit as exc:
+            assert exc.code == 0
+
+        assert capsys.readouterr().out == f"{__version__}\n"
+
+    def test_list_profiles_does_not_load_click_or_boto3(self, tmp_path):
+        """Test that list-profiles is answered without importing click or boto3."""
+        # Run in a fresh interpreter, since this one has already imported both
+        code = (
+            "import sys; sys.argv = ['aws-ses', 'list-profiles']; "
+            "from aws_ses.cli import main; main(); "
+            "sys.exit(any(m in sys.modules for m in ('click', 'boto3', 'botocore')))"
+        )
+        credentials_file = tmp_path / "credentials"
+        credentials_file.write_text("[dev]\n")
+        src = os.path.abspath(os.path.join(os.path.dirname(__file__), "../src"))
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            env={
+                **os.environ,
+                "PYTHONPATH": src,
+                "AWS_CONFIG_FILE": str(tmp_path / "config"),
+                "AWS_SHARED_CREDENTIALS_FILE": str(credentials_file),
+            },
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0
+        assert "dev (latest)" in result.stdout
@@ -1,36 +1,60 @@
 """
 Unit tests for the AWS Lambda handler.
 """
-import sys
-import os
-
-# Add the src directory to the path so we can import the aws_ses module
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
-
 import json
 import os
-from unittest.mock import MagicMock, patch
+import subprocess
+import sys
+from types import MappingProxyType
+from unittest.mock import Mock
 
 import pytest
-from botocore.exceptions import ClientError
 
+from aws_ses import lambda_handler
 from aws_ses.lambda_handler import handler
+from aws_ses.ses_client import SESClient
+
+# Decoder for response bodies, built once for the module
+_loads = json.JSONDecoder().decode
+
+# Event keys the handler forwards to SESClient.send_email as keyword arguments
+_SEND_EMAIL_KEYS = (
+    "source",
+    "to_addresses",
+    "subject",
+    "body_text",
+    "body_html",
+    "cc_addresses",
+    "bcc_addresses",
+    "reply_to_addresses",
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_cached_clients():
+    """Make sure each test builds its own (mocked) SES client."""
+    lambda_handler._CLIENTS.clear()
+    yield
+    lambda_handler._CLIENTS.clear()
 
 
 @pytest.fixture
-def mock_aws_credentials():
-    """Mock AWS credentials for tests."""
-    os.environ["AWS_ACCESS_KEY_ID"] = "testing"
-    os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
-    os.environ["AWS_SECURITY_TOKEN"] = "testing"
-    os.environ["AWS_SESSION_TOKEN"] = "testing"
-    os.environ["AWS_DEFAULT_REGION"] = "us-east-1"
+def ses_client_mock():
+    """Create a fresh SESClient instance mock for each test."""
+    return Mock(spec=SESClient)
 
 
 @pytest.fixture
-def valid_event():
-    """Create a valid Lambda event for testing."""
-    return {
+def ses_client_cls(monkeypatch, ses_client_mock):
+    """Replace SESClient in the handler module with a mock class."""
+    cls = Mock(return_value=ses_client_mock)
+    monkeypatch.setattr(lambda_handler, "SESClient", cls)
+    return cls
+
+
+# Shared, read-only Lambda events
+VALID_EVENT = MappingProxyType(
+    {
         "source": "sender@example.com",
         "to_addresses": "recipient@example.com",
         "subject": "Test Subject",
@@ -40,192 +64,175 @@ def valid_event():
         "bcc_addresses": ["bcc@example.com"],
         "reply_to_addresses": ["reply@example.com"],
         "profile_name": "default",
-        "region_name": "us-east-1"
+        "region_name": "us-east-1",
     }
+)
 
-
-@pytest.fixture
-def minimal_event():
-    """Create a minimal valid Lambda event for testing."""
-    return {
+MINIMAL_EVENT = MappingProxyType(
+    {
         "source": "sender@example.com",
         "to_addresses": "recipient@example.com",
         "subject": "Test Subject",
-        "body_text": "Test Body"
+        "body_text": "Test Body",
     }
+)
 
-
-@pytest.fixture
-def invalid_event():
-    """Create an invalid Lambda event for testing (missing required fields)."""
-    return {
+# Missing to_addresses and body_text
+INVALID_EVENT = MappingProxyType(
+    {
         "source": "sender@example.com",
-        # Missing to_addresses
         "subject": "Test Subject",
-        # Missing body_text
     }
+)
 
 
 class TestLambdaHandler:
     """Test cases for the Lambda handler."""
 
-    @patch("aws_ses.lambda_handler.SESClient")
-    def test_handler_success(self, mock_ses_client, valid_event, mock_aws_credentials):
+    def test_handler_success(self, ses_client_cls, ses_client_mock):
         """Test successful email sending through Lambda."""
-        # Mock the SESClient instance
-        mock_client_instance = MagicMock()
-        mock_ses_client.return_value = mock_client_instance
-        
         # Mock the send_email method to return a successful response
-        mock_client_instance.send_email.return_value = {"MessageId": "test-message-id"}
+        ses_client_mock.send_email.return_value = {"MessageId": "test-message-id"}
         
         # Call the handler
-        response = handler(valid_event, {})
+        response = handler(VALID_EVENT, {})
         
         # Verify the response
         assert response["statusCode"] == 200
         assert "body" in response
         
-        body = json.loads(response["body"])
+        body = _loads(response["body"])
         assert body["message"] == "Email sent successfully"
         assert body["messageId"] == "test-message-id"
         
         # Verify SESClient was initialized with the correct parameters
-        mock_ses_client.assert_called_once_with(
-            profile_name=valid_event["profile_name"],
-            region_name=valid_event["region_name"]
+        ses_client_cls.assert_called_once_with(
+            profile_name=VALID_EVENT["profile_name"],
+            region_name=VALID_EVENT["region_name"]
         )
         
         # Verify send_email was called with the correct parameters
-        mock_client_instance.send_email.assert_called_once_with(
-            source=valid_event["source"],
-            to_addresses=valid_event["to_addresses"],
-            subject=valid_event["subject"],
-            body_text=valid_event["body_text"],
-            body_html=valid_event["body_html"],
-            cc_addresses=valid_event["cc_addresses"],
-            bcc_addresses=valid_event["bcc_addresses"],
-            reply_to_addresses=valid_event["reply_to_addresses"]
-        )
+        assert ses_client_mock.send_email.call_count == 1
+        assert ses_client_mock.send_email.call_args[1] == {
+            key: VALID_EVENT[key] for key in _SEND_EMAIL_KEYS
+        }
 
-    @patch("aws_ses.lambda_handler.SESClient")
-    def test_handler_minimal_event(self, mock_ses_client, minimal_event, mock_aws_credentials):
+    def test_handler_minimal_event(self, ses_client_cls, ses_client_mock):
         """Test Lambda with minimal valid event."""
-        # Mock the SESClient instance
-        mock_client_instance = MagicMock()
-        mock_ses_client.return_value = mock_client_instance
-        
         # Mock the send_email method to return a successful response
-        mock_client_instance.send_email.return_value = {"MessageId": "test-message-id"}
+        ses_client_mock.send_email.return_value = {"MessageId": "test-message-id"}
         
         # Call the handler
-        response = handler(minimal_event, {})
+        response = handler(MINIMAL_EVENT, {})
         
         # Verify the response
         assert response["statusCode"] == 200
         assert "body" in response
         
-        body = json.loads(response["body"])
+        body = _loads(response["body"])
         assert body["message"] == "Email sent successfully"
         assert body["messageId"] == "test-message-id"
         
         # Verify SESClient was initialized with the correct parameters
-        mock_ses_client.assert_called_once_with(
+        ses_client_cls.assert_called_once_with(
             profile_name=None,
             region_name=None
         )
         
         # Verify send_email was called with the correct parameters
-        mock_client_instance.send_email.assert_called_once_with(
-            source=minimal_event["source"],
-            to_addresses=minimal_event["to_addresses"],
-            subject=minimal_event["subject"],
-            body_text=minimal_event["body_text"],
-            body_html=None,
-            cc_addresses=None,
-            bcc_addresses=None,
-            reply_to_addresses=None
-        )
+        assert ses_client_mock.send_email.call_count == 1
+        assert ses_client_mock.send_email.call_args[1] == {
+            key: MINIMAL_EVENT.get(key) for key in _SEND_EMAIL_KEYS
+        }
 
-    def test_handler_invalid_event(self, invalid_event, mock_aws_credentials):
+    def test_handler_invalid_event(self):
         """Test Lambda with invalid event (missing required fields)."""
         # Call the handler
-        response = handler(invalid_event, {})
+        response = handler(INVALID_EVENT, {})
         
         # Verify the response
         assert response["statusCode"] == 400
         assert "body" in response
         
-        body = json.loads(response["body"])
+        body = _loads(response["body"])
         assert "Missing required parameters" in body["message"]
 
-    @patch("aws_ses.lambda_handler.SESClient")
-    def test_handler_with_environment_variables(self, mock_ses_client, minimal_event, mock_aws_credentials):
+    def test_handler_with_environment_variables(
+        self, ses_client_cls, ses_client_mock, monkeypatch
+    ):
         """Test Lambda using environment variables for profile and region."""
         # Set environment variables
-        os.environ["AWS_PROFILE"] = "env_profile"
-        os.environ["AWS_REGION"] = "us-west-2"
-        
-        # Mock the SESClient instance
-        mock_client_instance = MagicMock()
-        mock_ses_client.return_value = mock_client_instance
+        monkeypatch.setenv("AWS_PROFILE", "env_profile")
+        monkeypatch.setenv("AWS_REGION", "us-west-2")
         
         # Mock the send_email method to return a successful response
-        mock_client_instance.send_email.return_value = {"MessageId": "test-message-id"}
+        ses_client_mock.send_email.return_value = {"MessageId": "test-message-id"}
         
         # Call the handler
-        response = handler(minimal_event, {})
+        response = handler(MINIMAL_EVENT, {})
         
         # Verify SESClient was initialized with environment variables
-        mock_ses_client.assert_called_once_with(
+        ses_client_cls.assert_called_once_with(
             profile_name="env_profile",
             region_name="us-west-2"
         )
-        
-        # Clean up environment variables
-        del os.environ["AWS_PROFILE"]
-        del os.environ["AWS_REGION"]
 
-    @patch("aws_ses.lambda_handler.SESClient")
-    def test_handler_error_handling(self, mock_ses_client, valid_event, mock_aws_credentials):
+    def test_handler_reuses_client(self, ses_client_cls, ses_client_mock):
+        """Test that warm invocations reuse the SES client."""
+        ses_client_mock.send_email.return_value = {"MessageId": "test-message-id"}
+
+        handler(VALID_EVENT, {})
+        response = handler(VALID_EVENT, {})
+
+        assert response["statusCode"] == 200
+        ses_client_cls.assert_called_once()
+        assert ses_client_mock.send_email.call_count == 2
+
+    def test_handler_error_handling(self, ses_client_cls, ses_client_mock):
         """Test error handling in Lambda."""
-        # Mock the SESClient instance
-        mock_client_instance = MagicMock()
-        mock_ses_client.return_value = mock_client_instance
-        
         # Mock the send_email method to raise an exception
         error_message = "Test error message"
-        mock_client_instance.send_email.side_effect = Exception(error_message)
+        ses_client_mock.send_email.side_effect = Exception(error_message)
         
         # Call the handler
-        response = handler(valid_event, {})
+        response = handler(VALID_EVENT, {})
         
         # Verify the response
         assert response["statusCode"] == 500
         assert "body" in response
         
-        body = json.loads(response["body"])
+        body = _loads(response["body"])
         assert "Error sending email" in body["message"]
         assert error_message in body["message"]
 
-    @patch("aws_ses.lambda_handler.SESClient")
-    def test_handler_client_error(self, mock_ses_client, valid_event, mock_aws_credentials):
+    def test_handler_client_error(self, ses_client_cls, ses_client_mock):
         """Test handling of boto3 ClientError in Lambda."""
-        # Mock the SESClient instance
-        mock_client_instance = MagicMock()
-        mock_ses_client.return_value = mock_client_instance
-        
+        from botocore.exceptions import ClientError
+
         # Mock the send_email method to raise a ClientError
         error_response = {"Error": {"Code": "MessageRejected", "Message": "Email address not verified"}}
-        mock_client_instance.send_email.side_effect = ClientError(error_response, "SendEmail")
+        ses_client_mock.send_email.side_effect = ClientError(error_response, "SendEmail")
         
         # Call the handler
-        response = handler(valid_event, {})
+        response = handler(VALID_EVENT, {})
         
         # Verify the response
         assert response["statusCode"] == 500
         assert "body" in response
         
-        body = json.loads(response["body"])
+        body = _loads(response["body"])
         assert "Error sending email" in body["message"]
         assert "MessageRejected" in body["message"]
+
+    def test_import_does_not_load_boto3(self):
+        """Test that importing the handler module leaves boto3 unloaded."""
+        # Run in a fresh interpreter, since this one has already imported boto3
+        code = (
+            "import sys, aws_ses.lambda_handler; "
+            "sys.exit('boto3' in sys.modules or 'botocore' in sys.modules)"
+        )
+        src = os.path.abspath(os.path.join(os.path.dirname(__file__), '../src'))
+        result = subprocess.run(
+            [sys.executable, "-c", code], env={**os.environ, "PYTHONPATH": src}
+        )
+        assert result.returncode == 0
@@ -1,55 +1,157 @@
 """
 Unit tests for the ProfileManager class.
 """
-import sys
 import os
 
-# Add the src directory to the path so we can import the aws_ses module
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
-
 import pytest
 from unittest.mock import patch
 
 from aws_ses.profile_manager import ProfileManager
 
 
+@pytest.fixture(autouse=True)
+def mock_session():
+    """Replace boto3.Session with a fresh mock so no test builds a real session."""
+    with patch("boto3.Session") as session:
+        yield session
+
+
+@pytest.fixture
+def aws_config_files(tmp_path, monkeypatch):
+    """Point the AWS config and credentials files at a temporary directory."""
+    config_file = tmp_path / "config"
+    credentials_file = tmp_path / "credentials"
+    monkeypatch.setenv("AWS_CONFIG_FILE", str(config_file))
+    monkeypatch.setenv("AWS_SHARED_CREDENTIALS_FILE", str(credentials_file))
+    ProfileManager.clear_cache()
+    yield config_file, credentials_file
+    ProfileManager.clear_cache()
+
+
 class TestProfileManager:
     """Test cases for the ProfileManager class."""
 
-    @patch("boto3.Session")
-    def test_get_available_profiles(self, mock_session):
+    def test_get_available_profiles(self, mock_session, aws_config_files):
         """Test getting available profiles."""
-        # Mock the available_profiles property
-        mock_session.return_value.available_profiles = ["default", "dev", "prod"]
-        
+        config_file, credentials_file = aws_config_files
+        config_file.write_text(
+            "[default]\nregion = us-east-1\n"
+            "[profile dev]\nregion = us-west-2\n"
+            "[sso-session corp]\nsso_region = us-east-1\n"
+        )
+        credentials_file.write_text(
+            "[default]\naws_access_key_id = a\n"
+            "[dev]\naws_access_key_id = b\n"
+            "[prod]\naws_access_key_id = c\n"
+        )
+
         profiles = ProfileManager.get_available_profiles()
-        
+
         assert profiles == ["default", "dev", "prod"]
-        mock_session.assert_called_once()
+        mock_session.assert_not_called()
+
+    def test_get_available_profiles_no_files(self, aws_config_files):
+        """Test getting available profiles when no AWS config files exist."""
+        assert ProfileManager.get_available_profiles() == []
+
+    def test_get_available_profiles_cached(self, aws_config_files):
+        """Test that the profile list is re-read only when a file changes."""
+        _, credentials_file = aws_config_files
+        credentials_file.write_text("[default]\n")
+        os.utime(credentials_file, ns=(1_000_000_000, 1_000_000_000))
+        assert ProfileManager.get_available_profiles() == ["default"]
+
+        # Same modification time and size: the cached list is used
+        credentials_file.write_text("[staging]\n")
+        os.utime(credentials_file, ns=(1_000_000_000, 1_000_000_000))
+        assert ProfileManager.get_available_profiles() == ["default"]
+
+        ProfileManager.clear_cache()
+        assert ProfileManager.get_available_profiles() == ["staging"]
+
+        credentials_file.write_text("[staging]\n[dev]\n")
+        assert ProfileManager.get_available_profiles() == ["staging", "dev"]
+
+    def test_repeated_lookups_read_files_once(self, mock_session, aws_config_files):
+        """Test that repeated lookups reuse one scan and never build a session."""
+        from aws_ses import profile_manager
+
+        config_file, credentials_file = aws_config_files
+        config_file.write_text("[default]\n[profile dev]\n")
+        credentials_file.write_text("[prod]\naws_access_key_id = a\n")
+
+        with patch.object(
+            profile_manager, "_read_sections", wraps=profile_manager._read_sections
+        ) as read_sections:
+            for _ in range(3):
+                assert ProfileManager.get_available_profiles() == [
+                    "default",
+                    "dev",
+                    "prod",
+                ]
+                assert ProfileManager.get_latest_profile() == "prod"
+                assert ProfileManager.validate_profile("latest") is True
+
+        # One scan reads the config and credentials files once each
+        assert read_sections.call_count == 2
+        mock_session.assert_not_called()
+
+    def test_get_latest_profile_with_profiles(self, aws_config_files):
+        """Test that the latest profile is the last one in the credentials file."""
+        config_file, credentials_file = aws_config_files
+        config_file.write_text("[default]\n[profile staging]\n")
+        credentials_file.write_text(
+            "[dev]\naws_access_key_id = a\n"
+            "[prod]\naws_access_key_id = b\n"
+            "[default]\naws_access_key_id = c\n"
+        )
 
-    @patch("aws_ses.profile_manager.ProfileManager.get_available_profiles")
-    def test_get_latest_profile_with_profiles(self, mock_get_profiles):
-        """Test getting the latest profile when profiles exist."""
-        mock_get_profiles.return_value = ["default", "dev", "prod"]
-        
         latest = ProfileManager.get_latest_profile()
-        
+
         assert latest == "prod"
-        mock_get_profiles.assert_called_once()
 
-    @patch("aws_ses.profile_manager.ProfileManager.get_available_profiles")
-    def test_get_latest_profile_no_profiles(self, mock_get_profiles):
+    def test_get_latest_profile_config_only(self, aws_config_files):
+        """Test the latest profile when the credentials file has no profiles."""
+        config_file, _ = aws_config_files
+        config_file.write_text("[default]\n[profile dev]\n[profile prod]\n")
+
+        latest = ProfileManager.get_latest_profile()
+
+        assert latest == "prod"
+
+    def test_get_latest_profile_credentials_default_only(self, aws_config_files):
+        """Test that a config profile beats a credentials file with only default."""
+        config_file, credentials_file = aws_config_files
+        config_file.write_text("[profile dev]\nregion = us-west-2\n")
+        credentials_file.write_text("[default]\naws_access_key_id = a\n")
+
+        assert ProfileManager.get_latest_profile() == "dev"
+
+    def test_get_latest_profile_default_only(self, aws_config_files):
+        """Test that default is the latest profile when it is the only one."""
+        _, credentials_file = aws_config_files
+        credentials_file.write_text("[default]\naws_access_key_id = a\n")
+
+        assert ProfileManager.get_latest_profile() == "default"
+
+    def test_get_available_profiles_indented_headers(self, aws_config_files):
+        """Test that indented section headers are recognised, as boto3 does."""
+        config_file, credentials_file = aws_config_files
+        config_file.write_text("  [profile dev]\nregion = us-west-2\n")
+        credentials_file.write_text("\t[prod]\naws_access_key_id = a\n")
+
+        assert ProfileManager.get_available_profiles() == ["dev", "prod"]
+
+    def test_get_latest_profile_no_profiles(self, aws_config_files):
         """Test getting the latest profile when no profiles exist."""
-        mock_get_profiles.return_value = []
-        
         latest = ProfileManager.get_latest_profile()
-        
+
         assert latest is None
-        mock_get_profiles.assert_called_once()
 
-    @patch("boto3.Session")
     @patch("aws_ses.profile_manager.ProfileManager.get_available_profiles")
-    def test_validate_profile_latest_with_profiles(self, mock_get_profiles, mock_session):
+    def test_validate_profile_latest_with_profiles(
+        self, mock_get_profiles, mock_session
+    ):
         """Test validating 'latest' profile when profiles exist."""
         mock_get_profiles.return_value = ["default", "dev", "prod"]
         
@@ -59,9 +161,10 @@ class TestProfileManager:
         mock_get_profiles.assert_called_once()
         mock_session.assert_not_called()
 
-    @patch("boto3.Session")
     @patch("aws_ses.profile_manager.ProfileManager.get_available_profiles")
-    def test_validate_profile_latest_no_profiles(self, mock_get_profiles, mock_session):
+    def test_validate_profile_latest_no_profiles(
+        self, mock_get_profiles, mock_session
+    ):
         """Test validating 'latest' profile when no profiles exist."""
         mock_get_profiles.return_value = []
         
@@ -71,23 +174,39 @@ class TestProfileManager:
         mock_get_profiles.assert_called_once()
         mock_session.assert_not_called()
 
-    @patch("boto3.Session")
-    def test_validate_profile_existing(self, mock_session):
+    def test_validate_profile_existing(self, mock_session, aws_config_files):
         """Test validating an existing profile."""
+        config_file, credentials_file = aws_config_files
+        config_file.write_text("[profile dev]\nregion = us-west-2\n")
+        credentials_file.write_text("[prod]\naws_access_key_id = a\n")
+
+        assert ProfileManager.validate_profile("dev") is True
+        assert ProfileManager.validate_profile("prod") is True
+        mock_session.assert_not_called()
+
+    def test_validate_profile_non_existing(self, mock_session, aws_config_files):
+        """Test validating a non-existing profile."""
+        _, credentials_file = aws_config_files
+        credentials_file.write_text("[default]\naws_access_key_id = a\n")
+
+        assert ProfileManager.validate_profile("nonexistent") is False
+        mock_session.assert_not_called()
+
+    def test_validate_profile_strict_existing(self, mock_session):
+        """Test strictly validating an existing profile."""
         # No exception means profile exists
-        result = ProfileManager.validate_profile("dev")
+        result = ProfileManager.validate_profile_strict("dev")
         
         assert result is True
         mock_session.assert_called_once_with(profile_name="dev")
 
-    @patch("boto3.Session")
-    def test_validate_profile_non_existing(self, mock_session):
-        """Test validating a non-existing profile."""
+    def test_validate_profile_strict_non_existing(self, mock_session):
+        """Test strictly validating a non-existing profile."""
         # Raise ProfileNotFound exception
         from botocore.exceptions import ProfileNotFound
         mock_session.side_effect = ProfileNotFound(profile="nonexistent")
         
-        result = ProfileManager.validate_profile("nonexistent")
+        result = ProfileManager.validate_profile_strict("nonexistent")
         
         assert result is False
         mock_session.assert_called_once_with(profile_name="nonexistent")
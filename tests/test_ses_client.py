@@ -1,138 +1,575 @@
 """
 Unit tests for the SESClient class.
 """
-import sys
-import os
-
-# Add the src directory to the path so we can import the aws_ses module
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+import contextlib
+import copy
+import threading
+import time
+from unittest.mock import patch
 
 import pytest
-from botocore.exceptions import ClientError
-from moto import mock_aws
 
-from aws_ses.ses_client import SESClient
+from aws_ses import ses_client as ses_client_module
+from aws_ses.profile_manager import ProfileManager
+from aws_ses.ses_client import SESClient, clear_client_cache
+
+
+@pytest.fixture(scope="session")
+def _ses_client_template(request, mock_aws_credentials):
+    """Start moto once per session and verify the test identities."""
+    from moto import mock_aws
+
+    stack = contextlib.ExitStack()
+    request.addfinalizer(stack.close)
+    # Only SES is mocked; a call to any other service fails instead of passing
+    stack.enter_context(mock_aws(config={"core": {"service_whitelist": ["ses"]}}))
+
+    client = SESClient(region_name="us-east-1")
+    # Verify a test email address for use in tests
+    client.verify_email_identity("sender@example.com")
+    client.verify_email_identity("recipient@example.com")
+    return client
 
 
 @pytest.fixture
-def mock_aws_credentials():
-    """Mock AWS credentials for tests."""
-    import os
-    os.environ["AWS_ACCESS_KEY_ID"] = "testing"
-    os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
-    os.environ["AWS_SECURITY_TOKEN"] = "testing"
-    os.environ["AWS_SESSION_TOKEN"] = "testing"
-    os.environ["AWS_DEFAULT_REGION"] = "us-east-1"
+def moto_ses_client(_ses_client_template):
+    """Yield the shared SES client, restoring moto's SES state afterwards."""
+    from moto.core import DEFAULT_ACCOUNT_ID
+    from moto.ses.models import ses_backends
+
+    backend = ses_backends[DEFAULT_ACCOUNT_ID]["us-east-1"]
+    snapshot = copy.deepcopy(backend.__dict__)
+    _ses_client_template._quota_cache = None
+    _ses_client_template._verified_cache = None
+    yield _ses_client_template
+    backend.__dict__.clear()
+    backend.__dict__.update(snapshot)
+
+
+_CANNED_RESPONSES = {
+    "send_email": {"MessageId": "test-message-id"},
+    "verify_email_identity": {"ResponseMetadata": {"HTTPStatusCode": 200}},
+    "list_identities": {"Identities": ["sender@example.com", "recipient@example.com"]},
+    "get_send_quota": {
+        "Max24HourSend": 200.0,
+        "MaxSendRate": 1.0,
+        "SentLast24Hours": 0.0,
+    },
+    "get_send_statistics": {"SendDataPoints": []},
+}
+
+
+_HTML_BODY = "<html><body><h1>Test HTML Body</h1></body></html>"
+
+
+def _expected_request(destination, body_html=None, reply_to=None):
+    """Build the SendEmail parameters expected for the send_email variants."""
+    body = {"Text": {"Data": "Test Body"}}
+    if body_html is not None:
+        body["Html"] = {"Data": body_html}
+    request = {
+        "Source": "sender@example.com",
+        "Destination": destination,
+        "Message": {"Subject": {"Data": "Test Subject"}, "Body": body},
+    }
+    if reply_to is not None:
+        request["ReplyToAddresses"] = reply_to
+    return request
 
 
 @pytest.fixture
-def ses_client(mock_aws_credentials):
-    """Create a mocked SES client for testing."""
-    with mock_aws():
-        client = SESClient(region_name="us-east-1")
-        # Verify a test email address for use in tests
-        client.verify_email_identity("sender@example.com")
-        client.verify_email_identity("recipient@example.com")
-        yield client
+def send_quota():
+    """Patch get_send_quota with a rate high enough not to slow the tests down."""
+    quota = {"Max24HourSend": 200.0, "MaxSendRate": 1000.0, "SentLast24Hours": 0.0}
+    with patch.object(SESClient, "get_send_quota", return_value=quota):
+        yield quota
 
 
-class TestSESClient:
-    """Test cases for the SESClient class."""
+@pytest.fixture
+def boto3_session():
+    """Patch boto3.Session with one whose SES client returns canned responses."""
+    clear_client_cache()
+    with patch("boto3.Session") as session_cls:
+        api = session_cls.return_value.client.return_value
+        for operation, response in _CANNED_RESPONSES.items():
+            getattr(api, operation).return_value = response
+        yield session_cls
+    clear_client_cache()
+
+
+@pytest.fixture
+def mocked_ses_client(boto3_session):
+    """Create an SESClient backed by the mocked boto3 session."""
+    return SESClient(region_name="us-east-1")
+
+
+class TestSESClientUnit:
+    """Test cases for SESClient against a mocked boto3 session."""
 
-    def test_init_default(self, mock_aws_credentials):
+    def test_init_default(self, boto3_session):
         """Test initialization with default parameters."""
         client = SESClient()
         assert client.profile_name is None
         assert client.region_name is None
-        assert client.session is not None
-        assert client.client is not None
+        assert client.session is boto3_session.return_value
+        assert client.client is boto3_session.return_value.client.return_value
+        boto3_session.assert_called_once_with()
 
-    def test_init_with_region(self, mock_aws_credentials):
+    def test_init_with_region(self, boto3_session):
         """Test initialization with region specified."""
         region = "us-west-2"
         client = SESClient(region_name=region)
         assert client.profile_name is None
         assert client.region_name == region
-        assert client.session is not None
-        assert client.client is not None
+        create_client = boto3_session.return_value.client
+        create_client.assert_called_once()
+        assert create_client.call_args[0] == ("ses",)
+        assert create_client.call_args[1]["region_name"] == region
 
-    def test_send_email_basic(self, ses_client):
-        """Test sending a basic email."""
-        response = ses_client.send_email(
-            source="sender@example.com",
-            to_addresses="recipient@example.com",
-            subject="Test Subject",
-            body_text="Test Body",
-        )
-        assert "MessageId" in response
-        assert isinstance(response["MessageId"], str)
+    def test_init_latest_profile(self, boto3_session):
+        """Test that 'latest' is resolved through ProfileManager."""
+        with patch.object(ProfileManager, "get_latest_profile", return_value="prod"):
+            client = SESClient(profile_name="latest", region_name="us-west-2")
+        assert client.profile_name == "prod"
+        boto3_session.assert_called_once_with(profile_name="prod")
 
-    def test_send_email_with_html(self, ses_client):
-        """Test sending an email with HTML content."""
-        response = ses_client.send_email(
-            source="sender@example.com",
-            to_addresses="recipient@example.com",
-            subject="Test Subject",
-            body_text="Test Body",
-            body_html="<html><body><h1>Test HTML Body</h1></body></html>",
-        )
-        assert "MessageId" in response
-        assert isinstance(response["MessageId"], str)
+    def test_init_latest_profile_without_profiles(self, boto3_session):
+        """Test that 'latest' with no profiles raises ProfileManager's error."""
+        with patch.object(ProfileManager, "get_latest_profile", return_value=None):
+            with pytest.raises(ValueError, match="when trying to use 'latest'"):
+                SESClient(profile_name="latest")
+        boto3_session.assert_not_called()
+
+    def test_init_shares_client_per_profile_and_region(self, boto3_session):
+        """Test that clients with the same profile and region share a session."""
+        first = SESClient(region_name="us-west-2")
+        second = SESClient(region_name="us-west-2")
+        SESClient(region_name="eu-west-1")
+        assert first.session is second.session
+        assert first.client is second.client
+        assert boto3_session.call_count == 2
+
+    def test_init_max_pool_connections(self, boto3_session):
+        """Test that the connection pool size is passed to the client config."""
+        client = SESClient(region_name="us-west-2", max_pool_connections=50)
+        create_client = boto3_session.return_value.client
+        assert client.max_pool_connections == 50
+        assert create_client.call_args[1]["config"].max_pool_connections == 50
+
+        SESClient(region_name="us-west-2")
+        assert create_client.call_count == 2
+
+    def test_init_has_no_instance_dict(self, boto3_session):
+        """Test that SESClient instances use slots rather than a __dict__."""
+        client = SESClient(region_name="us-west-2")
+        assert not hasattr(client, "__dict__")
+        with pytest.raises(AttributeError):
+            client.unexpected = True
+
+    def test_clear_client_cache(self, boto3_session):
+        """Test that clearing the cache forces a new client to be built."""
+        SESClient(region_name="us-west-2")
+        clear_client_cache()
+        SESClient(region_name="us-west-2")
+        assert boto3_session.call_count == 2
 
-    def test_send_email_with_cc_bcc(self, ses_client):
-        """Test sending an email with CC and BCC recipients."""
-        response = ses_client.send_email(
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            (
+                {"to_addresses": "recipient@example.com"},
+                _expected_request({"ToAddresses": ["recipient@example.com"]}),
+            ),
+            (
+                {"to_addresses": "recipient@example.com", "body_html": _HTML_BODY},
+                _expected_request(
+                    {"ToAddresses": ["recipient@example.com"]}, body_html=_HTML_BODY
+                ),
+            ),
+            (
+                {
+                    "to_addresses": ["recipient@example.com", "recipient2@example.com"],
+                    "cc_addresses": ["cc@example.com"],
+                    "bcc_addresses": ["bcc@example.com"],
+                    "reply_to_addresses": ["reply@example.com"],
+                },
+                _expected_request(
+                    {
+                        "ToAddresses": [
+                            "recipient@example.com",
+                            "recipient2@example.com",
+                        ],
+                        "CcAddresses": ["cc@example.com"],
+                        "BccAddresses": ["bcc@example.com"],
+                    },
+                    reply_to=["reply@example.com"],
+                ),
+            ),
+            (
+                {
+                    "to_addresses": "recipient@example.com",
+                    "cc_addresses": "cc@example.com",
+                    "bcc_addresses": "bcc@example.com",
+                    "reply_to_addresses": "reply@example.com",
+                },
+                _expected_request(
+                    {
+                        "ToAddresses": ["recipient@example.com"],
+                        "CcAddresses": ["cc@example.com"],
+                        "BccAddresses": ["bcc@example.com"],
+                    },
+                    reply_to=["reply@example.com"],
+                ),
+            ),
+            (
+                {
+                    "to_addresses": ("recipient@example.com", "recipient2@example.com"),
+                    "cc_addresses": ("cc@example.com",),
+                },
+                _expected_request(
+                    {
+                        "ToAddresses": [
+                            "recipient@example.com",
+                            "recipient2@example.com",
+                        ],
+                        "CcAddresses": ["cc@example.com"],
+                    }
+                ),
+            ),
+        ],
+        ids=["basic", "html", "cc_bcc", "string_addresses", "tuple_addresses"],
+    )
+    def test_send_email_variants(self, mocked_ses_client, kwargs, expected):
+        """Test that each body and address variant builds the right request."""
+        response = mocked_ses_client.send_email(
             source="sender@example.com",
-            to_addresses=["recipient@example.com", "recipient2@example.com"],
-            cc_addresses=["cc@example.com"],
-            bcc_addresses=["bcc@example.com"],
-            reply_to_addresses=["reply@example.com"],
             subject="Test Subject",
             body_text="Test Body",
+            **kwargs,
         )
-        assert "MessageId" in response
-        assert isinstance(response["MessageId"], str)
+        assert response is mocked_ses_client.client.send_email.return_value
+        assert mocked_ses_client.client.send_email.call_args[1] == expected
 
-    def test_send_email_string_to_list_conversion(self, ses_client):
-        """Test that string addresses are converted to lists."""
-        response = ses_client.send_email(
+    def test_send_email_empty_string_addresses(self, mocked_ses_client):
+        """Test that empty optional address strings are left out of the request."""
+        mocked_ses_client.send_email(
             source="sender@example.com",
             to_addresses="recipient@example.com",
-            cc_addresses="cc@example.com",
-            bcc_addresses="bcc@example.com",
-            reply_to_addresses="reply@example.com",
             subject="Test Subject",
             body_text="Test Body",
+            cc_addresses="",
+            bcc_addresses="",
+            reply_to_addresses="",
         )
-        assert "MessageId" in response
-        assert isinstance(response["MessageId"], str)
 
-    def test_verify_email_identity(self, ses_client):
+        sent = mocked_ses_client.client.send_email.call_args[1]
+        assert sent["Destination"] == {"ToAddresses": ["recipient@example.com"]}
+        assert "ReplyToAddresses" not in sent
+
+    def test_rate_limiter_spaces_starts(self, monkeypatch):
+        """Test that the rate limiter spaces starts by the weighted interval."""
+        clock = [100.0]
+
+        def sleep(seconds):
+            clock[0] += seconds
+
+        monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+        monkeypatch.setattr(time, "sleep", sleep)
+
+        limiter = ses_client_module._RateLimiter(2.0)
+        starts = []
+        for count in (1, 1, 3, 1):
+            limiter.wait(count)
+            starts.append(clock[0])
+
+        assert starts == [100.0, 100.5, 101.0, 102.5]
+
+    def test_send_emails_bulk_paces_to_send_rate(self, mocked_ses_client):
+        """Test that bulk sends start no faster than MaxSendRate."""
+        rate = 20.0
+        mocked_ses_client.client.get_send_quota.return_value = {"MaxSendRate": rate}
+        starts = []
+
+        def send_email(**kwargs):
+            starts.append(time.monotonic())
+            return {"MessageId": "test-message-id"}
+
+        mocked_ses_client.client.send_email.side_effect = send_email
+        messages = [
+            {
+                "source": "sender@example.com",
+                "to_addresses": "recipient@example.com",
+                "subject": f"Test Subject {i}",
+                "body_text": "Test Body",
+            }
+            for i in range(6)
+        ]
+
+        results = list(mocked_ses_client.send_emails_bulk(messages, max_in_flight=6))
+
+        assert len(results) == len(messages)
+        starts.sort()
+        # Five intervals of 1/rate seconds, with a little slack for the clock
+        assert starts[-1] - starts[0] >= 0.9 * (len(messages) - 1) / rate
+
+    def test_send_emails_bulk_weights_by_recipients(self, mocked_ses_client):
+        """Test that each To, CC and BCC recipient counts towards the send rate."""
+        rate = 20.0
+        mocked_ses_client.client.get_send_quota.return_value = {"MaxSendRate": rate}
+        starts = []
+
+        def send_email(**kwargs):
+            starts.append(time.monotonic())
+            return {"MessageId": "test-message-id"}
+
+        mocked_ses_client.client.send_email.side_effect = send_email
+        messages = [
+            {
+                "source": "sender@example.com",
+                "to_addresses": ["a@example.com", "b@example.com"],
+                "cc_addresses": "c@example.com",
+                "bcc_addresses": ("d@example.com",),
+                "subject": "Test Subject",
+                "body_text": "Test Body",
+            },
+            {
+                "source": "sender@example.com",
+                "to_addresses": "e@example.com",
+                "subject": "Test Subject",
+                "body_text": "Test Body",
+            },
+        ]
+        counts = []
+        wait = ses_client_module._RateLimiter.wait
+
+        def record_wait(limiter, count=1):
+            counts.append(count)
+            wait(limiter, count)
+
+        with patch.object(ses_client_module._RateLimiter, "wait", record_wait):
+            list(mocked_ses_client.send_emails_bulk(messages, max_in_flight=1))
+
+        assert counts == [4, 1]
+        # The four-recipient message holds off the next start for 4/rate seconds
+        assert starts[1] - starts[0] >= 0.9 * 4 / rate
+
+    def test_send_bulk_templated_weights_by_recipients(self, mocked_ses_client):
+        """Test that a chunk counts every address across its destinations."""
+        mocked_ses_client.client.get_send_quota.return_value = {"MaxSendRate": 1000.0}
+        mocked_ses_client.client.send_bulk_templated_email.return_value = {"Status": []}
+        destinations = [
+            {"ToAddresses": ["a@example.com", "b@example.com", "c@example.com"]},
+            {"ToAddresses": "d@example.com"},
+        ]
+        counts = []
+        wait = ses_client_module._RateLimiter.wait
+
+        def record_wait(limiter, count=1):
+            counts.append(count)
+            wait(limiter, count)
+
+        with patch.object(ses_client_module._RateLimiter, "wait", record_wait):
+            list(
+                mocked_ses_client.send_bulk_templated(
+                    "sender@example.com", "welcome", destinations
+                )
+            )
+
+        assert counts == [4]
+
+    def test_send_emails_bulk_bounds_in_flight(self, mocked_ses_client):
+        """Test that no more than max_in_flight sends run at once."""
+        mocked_ses_client.client.get_send_quota.return_value = {"MaxSendRate": 1000.0}
+        lock = threading.Lock()
+        in_flight = [0]
+        peak = [0]
+
+        def send_email(**kwargs):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+            return {"MessageId": "test-message-id"}
+
+        mocked_ses_client.client.send_email.side_effect = send_email
+        messages = [
+            {
+                "source": "sender@example.com",
+                "to_addresses": "recipient@example.com",
+                "subject": f"Test Subject {i}",
+                "body_text": "Test Body",
+            }
+            for i in range(12)
+        ]
+
+        results = list(mocked_ses_client.send_emails_bulk(messages, max_in_flight=3))
+
+        assert len(results) == len(messages)
+        assert 1 <= peak[0] <= 3
+
+    def test_verify_email_identity(self, mocked_ses_client):
         """Test verifying an email identity."""
-        response = ses_client.verify_email_identity("test@example.com")
-        assert response is not None
-        # The response should be a dict with metadata
-        assert isinstance(response, dict)
+        api = mocked_ses_client.client
+        response = mocked_ses_client.verify_email_identity("test@example.com")
+        api.verify_email_identity.assert_called_once_with(
+            EmailAddress="test@example.com"
+        )
+        assert response is api.verify_email_identity.return_value
 
-    def test_list_verified_email_addresses(self, ses_client):
+    def test_list_verified_email_addresses(self, mocked_ses_client):
         """Test listing verified email addresses."""
-        # We've already verified two emails in the fixture
-        emails = ses_client.list_verified_email_addresses()
-        assert isinstance(emails, list)
-        assert len(emails) >= 2
-        assert "sender@example.com" in emails
-        assert "recipient@example.com" in emails
-
-    def test_get_send_quota(self, ses_client):
+        api = mocked_ses_client.client
+        api.list_identities.return_value = {"Identities": ["a@example.com"]}
+        emails = mocked_ses_client.list_verified_email_addresses()
+        api.list_identities.assert_called_once_with(IdentityType="EmailAddress")
+        assert emails == ["a@example.com"]
+
+    def test_list_verified_email_addresses_empty(self, mocked_ses_client):
+        """Test that a response without identities gives an empty list."""
+        mocked_ses_client.client.list_identities.return_value = {}
+        assert mocked_ses_client.list_verified_email_addresses() == []
+
+    def test_get_send_quota(self, mocked_ses_client):
         """Test getting the send quota."""
-        quota = ses_client.get_send_quota()
-        assert isinstance(quota, dict)
-        assert "Max24HourSend" in quota
-        assert "MaxSendRate" in quota
-        assert "SentLast24Hours" in quota
+        api = mocked_ses_client.client
+        quota = mocked_ses_client.get_send_quota()
+        api.get_send_quota.assert_called_once_with()
+        assert quota is api.get_send_quota.return_value
 
-    def test_get_send_statistics(self, ses_client):
+    def test_get_send_statistics(self, mocked_ses_client):
         """Test getting send statistics."""
-        stats = ses_client.get_send_statistics()
-        assert isinstance(stats, dict)
-        assert "SendDataPoints" in stats
+        api = mocked_ses_client.client
+        stats = mocked_ses_client.get_send_statistics()
+        api.get_send_statistics.assert_called_once_with()
+        assert stats is api.get_send_statistics.return_value
+
+
+@pytest.mark.slow
+class TestSESClientIntegration:
+    """Round-trip test cases for SESClient against moto's SES backend."""
+
+    def test_send_email_error_is_logged(self, moto_ses_client, caplog, capsys):
+        """Test that send errors are logged rather than printed, then re-raised."""
+        from botocore.exceptions import ClientError
+
+        with pytest.raises(ClientError):
+            moto_ses_client.send_email(
+                source="unverified@example.com",
+                to_addresses="recipient@example.com",
+                subject="Test Subject",
+                body_text="Test Body",
+            )
+        assert "Error sending email" in caplog.text
+        assert capsys.readouterr().out == ""
+
+    def test_get_send_quota_cached(self, moto_ses_client):
+        """Test that the send quota is reused until refreshed."""
+        quota = moto_ses_client.get_send_quota()
+        assert moto_ses_client.get_send_quota() is quota
+        assert moto_ses_client.get_send_quota(force_refresh=True) is not quota
+
+    def test_list_verified_email_addresses_cached(self, moto_ses_client):
+        """Test that the verified list is cached and refreshed after verifying."""
+        emails = moto_ses_client.list_verified_email_addresses()
+        assert moto_ses_client.list_verified_email_addresses() is emails
+
+        moto_ses_client.verify_email_identity("new@example.com")
+        assert "new@example.com" in moto_ses_client.list_verified_email_addresses()
+
+    def test_send_emails_bulk(self, moto_ses_client, send_quota):
+        """Test sending several emails concurrently."""
+        messages = [
+            {
+                "source": "sender@example.com",
+                "to_addresses": f"recipient{i}@example.com",
+                "subject": f"Test Subject {i}",
+                "body_text": "Test Body",
+            }
+            for i in range(5)
+        ]
+        results = list(moto_ses_client.send_emails_bulk(messages, max_in_flight=2))
+
+        assert len(results) == len(messages)
+        assert sorted(m["subject"] for m, _ in results) == sorted(
+            m["subject"] for m in messages
+        )
+        for _, response in results:
+            assert isinstance(response["MessageId"], str)
+
+    def test_send_emails_bulk_reports_errors(self, moto_ses_client, send_quota):
+        """Test that a failed send is yielded instead of raised."""
+        from botocore.exceptions import ClientError
+
+        messages = [
+            {
+                "source": "sender@example.com",
+                "to_addresses": "recipient@example.com",
+                "subject": "Test Subject",
+                "body_text": "Test Body",
+            },
+            {
+                "source": "unverified@example.com",
+                "to_addresses": "recipient@example.com",
+                "subject": "Test Subject",
+                "body_text": "Test Body",
+            },
+        ]
+        results = dict(
+            (m["source"], r) for m, r in moto_ses_client.send_emails_bulk(messages)
+        )
+
+        assert "MessageId" in results["sender@example.com"]
+        assert isinstance(results["unverified@example.com"], ClientError)
+
+    def test_template_lifecycle(self, moto_ses_client):
+        """Test creating, updating and deleting a template."""
+        from botocore.exceptions import ClientError
+
+        moto_ses_client.create_template(
+            "welcome", "Hello {{name}}", body_text="Welcome, {{name}}!"
+        )
+        moto_ses_client.update_template(
+            "welcome", "Hi {{name}}", body_html="<p>Welcome, {{name}}!</p>"
+        )
+        response = moto_ses_client.client.get_template(TemplateName="welcome")
+        assert response["Template"]["SubjectPart"] == "Hi {{name}}"
+
+        moto_ses_client.delete_template("welcome")
+        with pytest.raises(ClientError):
+            moto_ses_client.client.get_template(TemplateName="welcome")
+
+    def test_send_bulk_templated(self, moto_ses_client, send_quota):
+        """Test that destinations are sent in groups of at most 50."""
+        moto_ses_client.create_template("welcome", "Hello {{name}}", body_text="Hi")
+        destinations = [
+            {
+                "ToAddresses": f"recipient{i}@example.com",
+                "ReplacementTemplateData": {"name": f"user{i}"},
+            }
+            for i in range(120)
+        ]
+        results = list(
+            moto_ses_client.send_bulk_templated(
+                "sender@example.com",
+                "welcome",
+                destinations,
+                default_data={"name": "friend"},
+            )
+        )
+
+        assert sorted(len(chunk) for chunk, _ in results) == [20, 50, 50]
+        for chunk, response in results:
+            assert len(response["Status"]) == len(chunk)
+
+    def test_send_bulk_templated_single_destination(self, moto_ses_client, send_quota):
+        """Test that a single destination uses SendTemplatedEmail."""
+        moto_ses_client.create_template("welcome", "Hello {{name}}", body_text="Hi")
+        destinations = [{"ToAddresses": "recipient@example.com"}]
+        [(chunk, response)] = moto_ses_client.send_bulk_templated(
+            "sender@example.com", "welcome", destinations
+        )
+
+        assert chunk == destinations
+        assert isinstance(response["MessageId"], str)